@@ -0,0 +1,189 @@
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+
+class SystemClock:
+    """Real clocks. Swap in any object with the same methods for testing."""
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def wall(self) -> float:
+        return time.time()
+
+    def boottime(self):
+        # Like monotonic, but keeps counting while the machine is suspended.
+        # Only available on Linux; elsewhere suspend and clock changes can't
+        # be told apart and are both reported as a "gap".
+        if hasattr(time, "CLOCK_BOOTTIME"):
+            return time.clock_gettime(time.CLOCK_BOOTTIME)
+        return None
+
+
+def parse_day_start(value) -> timedelta:
+    """Turn an "HH:MM" setting into an offset from local midnight.
+
+    An unquoted ``10:00`` in the YAML file is loaded as the integer 600, so
+    integers are taken as minutes. Anything unreadable or outside 0-24h
+    falls back to midnight.
+    """
+    try:
+        if isinstance(value, int) and not isinstance(value, bool):
+            offset = timedelta(minutes=value)
+        else:
+            hours, _, minutes = str(value).strip().partition(":")
+            offset = timedelta(hours=int(hours), minutes=int(minutes or 0))
+    except (TypeError, ValueError):
+        print(f"Ignoring invalid day_starts_at {value!r}, using 00:00")
+        return timedelta(0)
+
+    if not timedelta(0) <= offset <= timedelta(hours=24):
+        print(f"Ignoring out of range day_starts_at {value!r}, using 00:00")
+        return timedelta(0)
+    return offset
+
+
+class TimeAccountant:
+    """Tracks focused time per day from the monotonic and wall clocks.
+
+    Elapsed time is measured on the monotonic clock, so time spent suspended
+    is never counted, and placed on the wall clock by anchoring each slice at
+    the current wall time, so a clock change only affects where later slices
+    land. Slices crossing the day boundary are split between both days.
+
+    Gaps between the two clocks are logged and the most recent ones kept in
+    ``events``. Telling a suspend from a clock change needs the boot-time
+    clock, which only Linux has; on macOS both are recorded as a "gap".
+    """
+
+    MAX_EVENTS = 20
+
+    def __init__(self, clock=None, day_start="00:00", gap_tolerance=2.0, tz=None):
+        self.clock = clock or SystemClock()
+        self.day_start = parse_day_start(day_start)
+        self.gap_tolerance = gap_tolerance
+        self.tz = tz
+
+        self.focus_seconds = {}
+        self.sessions = {}
+        self.events = deque(maxlen=self.MAX_EVENTS)
+
+        self.is_tracking = False
+        self.is_focused = False
+        self._last_mono = None
+        self._last_wall = None
+        self._last_boot = None
+        self._carry = 0.0
+
+    def day_of(self, wall: float):
+        local = datetime.fromtimestamp(wall, self.tz)
+        return (local - self.day_start).date()
+
+    def _next_boundary(self, wall: float) -> float:
+        # When the day start falls in the hour repeated as the clocks go
+        # back, its first occurrence can already be behind us, so take the
+        # earliest reading of the boundary that is still ahead.
+        day = self.day_of(wall)
+        while True:
+            day += timedelta(days=1)
+            boundary = datetime(day.year, day.month, day.day, tzinfo=self.tz) + self.day_start
+            for fold in (0, 1):
+                timestamp = boundary.replace(fold=fold).timestamp()
+                if timestamp > wall:
+                    return timestamp
+
+    def current_day(self):
+        return self.day_of(self.clock.wall())
+
+    def set_day_start(self, value):
+        self.day_start = parse_day_start(value)
+
+    def start(self, focused=True):
+        """Begin measuring. Only focused spans are credited to the day buckets.
+
+        The unreturned fraction of a second survives a pause, but is dropped
+        when switching between focused and unfocused time.
+        """
+        if focused != self.is_focused:
+            self._carry = 0.0
+        self.is_tracking = True
+        self.is_focused = focused
+        self._last_mono = self.clock.monotonic()
+        self._last_wall = self.clock.wall()
+        self._last_boot = self.clock.boottime()
+
+    def stop(self, limit=None) -> int:
+        """Account for the time since the last tick and stop measuring."""
+        elapsed = self.tick(limit) if self.is_tracking else 0
+        self.is_tracking = False
+        return elapsed
+
+    def tick(self, limit=None) -> int:
+        """Account for the time since the last call.
+
+        Returns the whole seconds that elapsed while the machine was awake,
+        capped at ``limit``. Fractions are carried over to the next tick, and
+        only the returned seconds are credited, so the countdown and the
+        focus total move together.
+        """
+        if not self.is_tracking:
+            return 0
+
+        mono = self.clock.monotonic()
+        wall = self.clock.wall()
+        boot = self.clock.boottime()
+
+        elapsed = max(0.0, mono - self._last_mono)
+        self._detect_gap(elapsed, wall - self._last_wall, boot)
+
+        self._last_mono = mono
+        self._last_wall = wall
+        self._last_boot = boot
+
+        if limit is not None:
+            elapsed = min(elapsed, max(0.0, limit - self._carry))
+
+        self._carry += elapsed
+        whole = int(self._carry)
+        self._carry -= whole
+
+        if self.is_focused and whole > 0:
+            self._credit(wall - whole, wall)
+        return whole
+
+    def _detect_gap(self, elapsed, wall_delta, boot):
+        drift = wall_delta - elapsed
+        if abs(drift) <= self.gap_tolerance:
+            return
+
+        if boot is not None and self._last_boot is not None:
+            asleep = (boot - self._last_boot) - elapsed
+            if asleep > self.gap_tolerance:
+                self._record("suspend", asleep)
+                drift -= asleep
+            if abs(drift) > self.gap_tolerance:
+                self._record("clock_jump", drift)
+        else:
+            self._record("gap" if drift > 0 else "clock_jump", drift)
+
+    def _record(self, kind, seconds):
+        print(f"Detected {kind.replace('_', ' ')} of {seconds:+.0f}s, not counted as focus time")
+        self.events.append((kind, seconds))
+
+    def _credit(self, begin: float, end: float):
+        while begin < end:
+            day = self.day_of(begin)
+            until = min(end, self._next_boundary(begin))
+            self.focus_seconds[day] = self.focus_seconds.get(day, 0.0) + (until - begin)
+            begin = until
+
+    def record_session(self):
+        day = self.current_day()
+        self.sessions[day] = self.sessions.get(day, 0) + 1
+
+    def today_sessions(self) -> int:
+        return self.sessions.get(self.current_day(), 0)
+
+    def today_focus_seconds(self) -> int:
+        return int(self.focus_seconds.get(self.current_day(), 0.0))
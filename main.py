@@ -4,6 +4,8 @@ import os
 from Foundation import *
 from AppKit import *
 from windows import ProgressWindowController, SettingsWindowController, StatisticsWindowController
+from accounting import TimeAccountant
+from schedule import DayPlan
 
 DEFAULT_SETTINGS = {
     "intervals": {
@@ -16,7 +18,8 @@ DEFAULT_SETTINGS = {
     "general": {
         "launch_at_startup": False,
         "shortcut_start_pause": "cmd+shift+s",
-        "shortcut_skip": "cmd+shift+n"
+        "shortcut_skip": "cmd+shift+n",
+        "day_starts_at": "00:00"
     }
 }
 
@@ -29,20 +32,18 @@ class PomodoroTimer(rumps.App):
         
         # Initialize timer state
         self.is_running = False
-        self.is_break = False
         self.timer = None
-        self.work_time = self.settings["intervals"]["work_duration"] * 60
-        self.short_break_time = self.settings["intervals"]["short_break_duration"] * 60
-        self.long_break_time = self.settings["intervals"]["long_break_duration"] * 60
-        self.remaining_time = self.work_time
         
         # Initialize session tracking
-        self.session_count = 0
-        self.sessions_before_long_break = self.settings["intervals"]["long_break_after"]
+        self.plan = DayPlan.from_settings(self.settings["intervals"])
+        self.phase_index = 0
+        self.remaining_time = self.current_phase.duration
         
         # Add statistics tracking
-        self.today_sessions = 0
-        self.today_work_time = 0
+        self.accounting = TimeAccountant(
+            day_start=self.settings["general"].get("day_starts_at", "00:00")
+        )
+        self.plan_day = self.accounting.current_day()
         
         # Menu items
         self.button_start = rumps.MenuItem("Start Work Timer", callback=self.start_work)
@@ -72,6 +73,26 @@ class PomodoroTimer(rumps.App):
             self.save_settings(settings)
         return settings
 
+    @property
+    def current_phase(self):
+        return self.plan.phase(self.phase_index)
+
+    @property
+    def is_break(self):
+        return self.current_phase.is_break
+
+    def start_new_day_if_idle(self):
+        # Begin a fresh plan once the day rolls over, unless a phase is running
+        today = self.accounting.current_day()
+        if self.is_running or today == self.plan_day:
+            return
+        self.plan_day = today
+        self.phase_index = 0
+        self.plan.rebuild(self.settings["intervals"])
+        self.remaining_time = self.current_phase.duration
+        self.timer = None
+        self.button_start.title = "Start Work Timer"
+
     def save_settings(self, settings):
         with open('pomodoro_settings.yaml', 'w') as f:
             yaml.dump(settings, f)
@@ -80,18 +101,15 @@ class PomodoroTimer(rumps.App):
         self.settings = new_settings
         self.save_settings(new_settings)
         
-        # Update runtime values
-        self.work_time = new_settings["intervals"]["work_duration"] * 60
-        self.short_break_time = new_settings["intervals"]["short_break_duration"] * 60
-        self.long_break_time = new_settings["intervals"]["long_break_duration"] * 60
-        self.sessions_before_long_break = new_settings["intervals"]["long_break_after"]
+        # Update runtime values, keeping a running phase's length as it is
+        first_changed = self.phase_index + 1 if self.is_running else self.phase_index
+        self.plan.rebuild(new_settings["intervals"], first_changed)
+        self.accounting.set_day_start(new_settings["general"].get("day_starts_at", "00:00"))
         
         # Update remaining time if not running
         if not self.is_running:
-            self.remaining_time = self.work_time if not self.is_break else (
-                self.long_break_time if self.session_count % self.sessions_before_long_break == 0 
-                else self.short_break_time
-            )
+            self.remaining_time = self.current_phase.duration
+        self.start_new_day_if_idle()
 
     def format_time(self, seconds):
         minutes, seconds = divmod(seconds, 60)
@@ -99,12 +117,13 @@ class PomodoroTimer(rumps.App):
 
     @rumps.clicked("Start Work Timer")
     def start_work(self, _):
+        self.start_new_day_if_idle()
         if not self.is_running:
             self.is_running = True
-            self.is_break = False
             if not self.timer:  # Only reset time if starting fresh
-                self.remaining_time = self.work_time
+                self.remaining_time = self.current_phase.duration
             self.timer = rumps.Timer(self.update_timer, 1)
+            self.accounting.start(focused=not self.is_break)
             self.timer.start()
             self.button_start.title = "Pause Timer"
         else:
@@ -112,12 +131,14 @@ class PomodoroTimer(rumps.App):
             self.is_running = False
             if self.timer:
                 self.timer.stop()
+            self.remaining_time -= self.accounting.stop(limit=self.remaining_time)
             self.button_start.title = "Resume Timer"
 
     @rumps.clicked("Stop Timer")
     def stop_timer(self, _):
         if self.timer:
             self.timer.stop()
+        self.remaining_time -= self.accounting.stop(limit=self.remaining_time)
         self.is_running = False
         self.button_start.title = "Start Work Timer"
         self.title = "🍅"
@@ -125,30 +146,28 @@ class PomodoroTimer(rumps.App):
     def update_timer(self, _):
         if self.remaining_time <= 0:
             self.timer.stop()
+            self.accounting.stop(limit=0)
             self.is_running = False
             
-            if self.is_break:
-                print(f"Ending break, starting work session {self.session_count + 1}")
+            finished = self.current_phase
+            self.phase_index += 1
+            upcoming = self.current_phase
+            self.remaining_time = upcoming.duration
+            
+            if finished.is_break:
+                print(f"Ending break, starting work session {upcoming.session}")
                 self.button_start.title = "Start Work Timer"
-                self.is_break = False
-                self.remaining_time = self.work_time
             else:
-                self.session_count += 1
-                print(f"Ending work session {self.session_count}")
-                print(f"Next break will be: {'long' if self.session_count % self.sessions_before_long_break == 0 else 'short'}")
-                self.today_sessions += 1
-                self.today_work_time += self.work_time
+                print(f"Ending work session {finished.session}")
+                print(f"Next break will be: {upcoming.name.lower()}")
+                self.accounting.record_session()
                 self.button_start.title = "Start Break"
-                self.is_break = True
-                if self.session_count % self.sessions_before_long_break == 0:
-                    self.remaining_time = self.long_break_time
-                else:
-                    self.remaining_time = self.short_break_time
             
             self.title = "🍅"
             return
 
-        self.remaining_time -= 1
+        # Count down by the awake time that actually passed, not by callbacks
+        self.remaining_time -= self.accounting.tick(limit=self.remaining_time)
         self.title = self.format_time(self.remaining_time)
         
         # Update progress window if it's open
@@ -156,28 +175,18 @@ class PomodoroTimer(rumps.App):
             self.progress_controller.updateProgress_(self.remaining_time)
 
     def show_progress(self, _):
-        total_time = self.work_time if not self.is_break else (
-            self.long_break_time if self.session_count % self.sessions_before_long_break == 0 
-            else self.short_break_time
-        )
-        
-        session_type = "Break" if self.is_break else "Work"
-        next_session = "Work" if self.is_break else "Break"
-        
-        # Fix the next break duration calculation
-        next_duration = self.work_time if self.is_break else (
-            # If this is a work session, check if the next break should be long
-            self.long_break_time if (self.session_count + 1) % self.sessions_before_long_break == 0 
-            else self.short_break_time
-        )
+        self.start_new_day_if_idle()
+        phase = self.current_phase
+        upcoming = self.plan.next(self.phase_index)
+        session_type = "Break" if phase.is_break else "Work"
         
         self.progress_controller = ProgressWindowController.alloc().\
             initWithProgress_total_type_count_next_(
                 self.remaining_time,
-                total_time,
+                phase.duration,
                 session_type,
-                self.session_count + 1,
-                f"{next_session} ({self.format_time(next_duration)})"
+                phase.session,
+                f"{upcoming.name} ({self.format_time(upcoming.duration)})"
             )
         self.progress_controller.showWindow_(None)
         NSApp.activateIgnoringOtherApps_(True)
@@ -189,9 +198,10 @@ class PomodoroTimer(rumps.App):
         NSApp.activateIgnoringOtherApps_(True)
 
     def show_stats(self, _):
+        self.start_new_day_if_idle()
         stats = {
-            'today_sessions': self.today_sessions,
-            'today_work_time': self.format_time(self.today_work_time)
+            'today_sessions': self.accounting.today_sessions(),
+            'today_work_time': self.format_time(self.accounting.today_focus_seconds())
         }
         
         self.stats_controller = StatisticsWindowController.alloc().\
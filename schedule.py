@@ -0,0 +1,86 @@
+from array import array
+from collections import namedtuple
+
+WORK, SHORT_BREAK, LONG_BREAK = 0, 1, 2
+PHASE_NAMES = ("Work", "Short Break", "Long Break")
+
+
+class Phase(namedtuple("Phase", "index kind duration session")):
+    __slots__ = ()
+
+    @property
+    def is_break(self):
+        return self.kind != WORK
+
+    @property
+    def name(self):
+        return PHASE_NAMES[self.kind]
+
+
+class DayPlan:
+    """The day's work and break phases, compiled from the interval settings.
+
+    Even phases are work sessions and odd phases the break after them. The
+    plan covers ``target_per_day`` sessions up front and grows on demand
+    when asked about later phases.
+    """
+
+    def __init__(self, work, short_break, long_break, long_break_after, target=8):
+        self._kinds = array("b")
+        self._lengths = array("l")
+        self._configure(work, short_break, long_break, long_break_after, target)
+        self._extend(2 * self.target)
+
+    @classmethod
+    def from_settings(cls, intervals):
+        return cls(**cls._durations(intervals))
+
+    @staticmethod
+    def _durations(intervals):
+        return {
+            "work": intervals["work_duration"] * 60,
+            "short_break": intervals["short_break_duration"] * 60,
+            "long_break": intervals["long_break_duration"] * 60,
+            "long_break_after": intervals["long_break_after"],
+            "target": intervals.get("target_per_day", 8),
+        }
+
+    def _configure(self, work, short_break, long_break, long_break_after, target):
+        self.work = work
+        self.short_break = short_break
+        self.long_break = long_break
+        self.long_break_after = long_break_after
+        self.target = max(1, target)
+
+    def _extend(self, count):
+        kinds = self._kinds
+        lengths = self._lengths
+        for index in range(len(kinds), count):
+            session = index // 2 + 1
+            if index % 2 == 0:
+                kind, duration = WORK, self.work
+            elif self.long_break_after and session % self.long_break_after == 0:
+                kind, duration = LONG_BREAK, self.long_break
+            else:
+                kind, duration = SHORT_BREAK, self.short_break
+            kinds.append(kind)
+            lengths.append(duration)
+
+    def _ensure(self, index):
+        if index >= len(self._kinds):
+            self._extend(max(index + 1, 2 * len(self._kinds)))
+
+    def phase(self, index) -> Phase:
+        self._ensure(index)
+        return Phase(index, self._kinds[index], self._lengths[index], index // 2 + 1)
+
+    def next(self, index) -> Phase:
+        return self.phase(index + 1)
+
+    def rebuild(self, intervals, from_index=0):
+        """Apply new settings to phase ``from_index`` onwards, keeping earlier phases."""
+        self._ensure(from_index)
+        self._configure(**self._durations(intervals))
+        del self._kinds[from_index:]
+        del self._lengths[from_index:]
+        self._extend(max(2 * self.target, from_index + 1))
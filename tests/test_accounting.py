@@ -0,0 +1,169 @@
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from accounting import TimeAccountant, parse_day_start
+
+
+class FakeClock:
+    def __init__(self, wall, boot=True):
+        self.mono = 1000.0
+        self.now = wall.timestamp()
+        self.boot = 5000.0 if boot else None
+
+    def monotonic(self):
+        return self.mono
+
+    def wall(self):
+        return self.now
+
+    def boottime(self):
+        return self.boot
+
+    def advance(self, seconds):
+        self.mono += seconds
+        self.now += seconds
+        if self.boot is not None:
+            self.boot += seconds
+
+    def suspend(self, seconds):
+        self.now += seconds
+        if self.boot is not None:
+            self.boot += seconds
+
+    def set_wall(self, seconds):
+        self.now += seconds
+
+
+def make(wall, **kwargs):
+    clock = FakeClock(wall, boot=kwargs.pop("boot", True))
+    kwargs.setdefault("tz", timezone.utc)
+    return clock, TimeAccountant(clock=clock, **kwargs)
+
+
+def run(clock, accountant, seconds, limit=None):
+    total = 0
+    for _ in range(seconds):
+        clock.advance(1)
+        total += accountant.tick(limit)
+    return total
+
+
+def test_parse_day_start():
+    assert parse_day_start("04:30") == timedelta(hours=4, minutes=30)
+    # An unquoted 10:00 in YAML is loaded as 600
+    assert parse_day_start(600) == timedelta(hours=10)
+    assert parse_day_start("6am") == timedelta(0)
+    assert parse_day_start("25:00") == timedelta(0)
+    assert parse_day_start(None) == timedelta(0)
+
+
+def test_splits_at_midnight():
+    clock, accountant = make(datetime(2026, 1, 1, 23, 59, 30, tzinfo=timezone.utc))
+    accountant.start()
+
+    assert run(clock, accountant, 60) == 60
+    assert accountant.focus_seconds == {date(2026, 1, 1): 30, date(2026, 1, 2): 30}
+    assert accountant.today_focus_seconds() == 30
+
+
+def test_splits_at_day_start():
+    clock, accountant = make(
+        datetime(2026, 1, 2, 3, 59, tzinfo=timezone.utc), day_start="04:00"
+    )
+    accountant.start()
+    run(clock, accountant, 120)
+
+    assert accountant.focus_seconds == {date(2026, 1, 1): 60, date(2026, 1, 2): 60}
+
+
+def test_no_negative_slice_when_clocks_go_back():
+    tz = ZoneInfo("America/New_York")
+    clock, accountant = make(
+        datetime(2024, 11, 3, 1, 10, fold=1, tzinfo=tz), day_start="01:30", tz=tz
+    )
+    accountant.start()
+    clock.advance(600)
+    accountant.tick()
+
+    assert accountant.focus_seconds == {date(2024, 11, 2): 600}
+
+
+def test_suspend_is_not_counted():
+    clock, accountant = make(datetime(2026, 1, 1, 12, tzinfo=timezone.utc))
+    accountant.start()
+    run(clock, accountant, 10)
+    clock.suspend(3600)
+    clock.advance(1)
+
+    assert accountant.tick() == 1
+    assert accountant.today_focus_seconds() == 11
+    assert list(accountant.events) == [("suspend", 3600)]
+
+
+def test_clock_jump_is_not_counted():
+    clock, accountant = make(datetime(2026, 1, 1, 12, tzinfo=timezone.utc))
+    accountant.start()
+    clock.set_wall(-600)
+    clock.advance(1)
+
+    assert accountant.tick() == 1
+    assert accountant.today_focus_seconds() == 1
+    assert list(accountant.events) == [("clock_jump", -600)]
+
+
+def test_gap_without_boot_clock():
+    clock, accountant = make(datetime(2026, 1, 1, 12, tzinfo=timezone.utc), boot=False)
+    accountant.start()
+    clock.suspend(3600)
+    clock.advance(1)
+    accountant.tick()
+
+    assert list(accountant.events) == [("gap", 3600)]
+
+
+def test_events_are_bounded():
+    clock, accountant = make(datetime(2026, 1, 1, 12, tzinfo=timezone.utc))
+    accountant.start()
+    for _ in range(TimeAccountant.MAX_EVENTS + 5):
+        clock.suspend(60)
+        accountant.tick()
+
+    assert len(accountant.events) == TimeAccountant.MAX_EVENTS
+
+
+def test_limit_caps_elapsed_and_credit():
+    clock, accountant = make(datetime(2026, 1, 1, 12, tzinfo=timezone.utc))
+    accountant.start()
+    clock.advance(600)
+
+    assert accountant.tick(limit=30) == 30
+    assert accountant.today_focus_seconds() == 30
+
+
+def test_pauses_keep_countdown_and_credit_together():
+    clock, accountant = make(datetime(2026, 1, 1, 12, tzinfo=timezone.utc))
+    counted = 0
+    for _ in range(8):
+        accountant.start()
+        clock.advance(0.75)
+        counted += accountant.stop(limit=1500)
+
+    assert counted == 6
+    assert accountant.today_focus_seconds() == 6
+
+
+def test_unfocused_time_is_not_credited():
+    clock, accountant = make(datetime(2026, 1, 1, 12, tzinfo=timezone.utc))
+    accountant.start(focused=False)
+
+    assert run(clock, accountant, 5) == 5
+    assert accountant.focus_seconds == {}
+
+
+def test_sessions_roll_over_with_the_day():
+    clock, accountant = make(datetime(2026, 1, 1, 23, 59, tzinfo=timezone.utc))
+    accountant.record_session()
+    assert accountant.today_sessions() == 1
+
+    clock.advance(120)
+    assert accountant.today_sessions() == 0